@@ -7,15 +7,17 @@ accuracy through web scraping.
 """
 
 import argparse
-import json
 import logging
+import os
 import shutil
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Set, Tuple, Type
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
 
-from pokedb.api_client import ApiClient
+from pokedb.api_client import ApiClient, get_api_client
 from pokedb.parsers import (
     AbilityParser,
     BaseParser,
@@ -27,9 +29,12 @@ from pokedb.scraper import scrape_pokemon_changes
 from pokedb.utils import (
     ConfigurationError,
     GenerationNotFoundError,
+    OutputPaths,
     PokedexMappingError,
+    extract_id_from_url,
     get_generation_dex_map,
     get_latest_generation,
+    json_dumps,
     load_config,
 )
 
@@ -87,11 +92,19 @@ Examples:
         action="store_true",
         help="Skip confirmation prompts and overwrite existing directories.",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the top-level index.json for human inspection (larger and slower).",
+    )
     return parser.parse_args()
 
 
 def gather_initial_data(
-    api_client: ApiClient, config: Dict[str, Any], target_gen: int
+    api_client: ApiClient,
+    config: Dict[str, Any],
+    target_gen: int,
+    generation_dex_map: Optional[Dict[int, str]] = None,
 ) -> Tuple[Dict[int, List[str]], Dict[int, str], Set[str]]:
     """
     Gathers the initial data needed by the parsers.
@@ -102,6 +115,9 @@ def gather_initial_data(
         api_client: The API client instance
         config: Configuration dictionary
         target_gen: The target generation number
+        generation_dex_map: Pre-fetched Pokédex map; the map is generation-
+                            independent, so multi-generation runs compute it
+                            once and pass it in instead of re-deriving it here
 
     Returns:
         A tuple of (generation_version_groups, generation_dex_map, target_versions)
@@ -114,32 +130,54 @@ def gather_initial_data(
     generation_version_groups: Dict[int, List[str]] = {}
     target_versions: Set[str] = set()
 
-    try:
-        gen_data = api_client.get(f"{config['api_base_url']}generation/")
+    # Hoist the URL prefixes out of the loops below; plain concatenation on a
+    # local beats a dict lookup plus f-string interpolation per iteration.
+    api_base_url = config["api_base_url"]
+    version_group_base = api_base_url + "version-group/"
 
-        for gen_ref in gen_data.get("results", []):
-            gen_num = int(gen_ref["url"].split("/")[-2])
+    try:
+        gen_data = api_client.get(api_base_url + "generation/")
+
+        gen_refs = [
+            (extract_id_from_url(gen_ref["url"]), gen_ref["url"])
+            for gen_ref in gen_data.get("results", [])
+        ]
+        gen_refs = [(num, url) for num, url in gen_refs if num <= target_gen]
+
+        # Each generation fetch is an independent network round trip, so run
+        # them concurrently instead of paying one RTT per generation.
+        max_workers = min(len(gen_refs), config["max_workers"]) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            gen_details_list = list(
+                executor.map(lambda ref: api_client.get(ref[1]), gen_refs)
+            )
 
-            if gen_num <= target_gen:
-                gen_details = api_client.get(gen_ref["url"])
-                version_groups = [
-                    vg["name"] for vg in gen_details.get("version_groups", [])
+        for (gen_num, _), gen_details in zip(gen_refs, gen_details_list):
+            version_groups = [
+                vg["name"] for vg in gen_details.get("version_groups", [])
+            ]
+            generation_version_groups[gen_num] = version_groups
+
+            # Only collect versions from the target generation. The
+            # version-group fetches are independent, so batch them too.
+            if gen_num == target_gen and version_groups:
+                version_group_urls = [
+                    version_group_base + version_group_name
+                    for version_group_name in version_groups
                 ]
-                generation_version_groups[gen_num] = version_groups
-
-                # Only collect versions from the target generation
-                if gen_num == target_gen:
-                    for version_group_name in version_groups:
-                        version_group_url = f"{config['api_base_url']}version-group/{version_group_name}"
-                        version_group_data = api_client.get(version_group_url)
-
+                workers = min(len(version_group_urls), config["max_workers"])
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    for version_group_data in executor.map(
+                        api_client.get, version_group_urls
+                    ):
                         for version in version_group_data.get("versions", []):
                             target_versions.add(version["name"])
 
     except Exception as e:
         raise GenerationNotFoundError(f"Could not fetch generation data: {e}")
 
-    generation_dex_map = get_generation_dex_map(api_client, config)
+    if generation_dex_map is None:
+        generation_dex_map = get_generation_dex_map(api_client, config)
     logger.info("Finished gathering data")
     return generation_version_groups, generation_dex_map, target_versions
 
@@ -178,8 +216,23 @@ def run_parsers(
         "pokemon": PokemonParser,
     }
 
-    for parser_name, ParserClass in parser_classes.items():
-        if args.all or parser_name in args.parsers:
+    # Resolve the selection before doing any work so only the requested
+    # parsers are ever constructed.
+    selected_classes = {
+        parser_name: ParserClass
+        for parser_name, ParserClass in parser_classes.items()
+        if args.all or parser_name in args.parsers
+    }
+    if not selected_classes:
+        logger.warning("No matching parsers selected.")
+        return all_summaries
+
+    futures: Dict[str, Any] = {}
+    # The parsers are independent of each other and almost entirely
+    # network-bound, so running them concurrently brings the total wall time
+    # down from the sum of their runtimes to roughly the longest one.
+    with ThreadPoolExecutor(max_workers=len(selected_classes)) as executor:
+        for parser_name, ParserClass in selected_classes.items():
             parser_kwargs = {
                 "config": final_config,
                 "api_client": api_client,
@@ -197,7 +250,10 @@ def run_parsers(
                     parser_kwargs["scraper_func"] = scrape_pokemon_changes
 
             parser_instance = ParserClass(**parser_kwargs)
-            summary_data = parser_instance.run()
+            futures[parser_name] = executor.submit(parser_instance.run)
+
+        for parser_name, future in futures.items():
+            summary_data = future.result()
 
             if isinstance(summary_data, list):
                 all_summaries[parser_name] = summary_data
@@ -214,6 +270,7 @@ def write_index_file(
     target_gen: int,
     top_level_output_dir: str,
     generation_version_groups: Dict[int, List[str]],
+    pretty: bool = False,
 ) -> None:
     """
     Writes the final top-level index.json file.
@@ -225,6 +282,8 @@ def write_index_file(
         target_gen: The target generation number
         top_level_output_dir: The output directory path
         generation_version_groups: Mapping of generations to version groups
+        pretty: Whether to indent the output for human inspection; the default
+                compact form is substantially smaller and faster to encode
     """
     if not all_summaries:
         logger.warning("No summary data was generated. Skipping index file.")
@@ -232,24 +291,33 @@ def write_index_file(
 
     logger.info("Creating top-level index.json...")
 
+    # Filter and materialize the summaries once; counts and the serialized
+    # payload then traverse the same concrete lists, and parsers that yield
+    # lazily would still be handled.
+    summaries = {
+        key: value if isinstance(value, list) else list(value)
+        for key, value in all_summaries.items()
+        if value
+    }
+
+    # Build the index in one shot; the summary lists are referenced rather
+    # than copied, so no second merged dict is materialized before the dump.
     final_index: Dict[str, Any] = {
         "metadata": {
             "generation": target_gen,
             "version_groups": generation_version_groups.get(target_gen, []),
             "createdAt": datetime.now(timezone.utc).isoformat(),
-            "counts": {
-                key: len(value) for key, value in all_summaries.items() if value
-            },
-        }
+            "counts": {key: len(value) for key, value in summaries.items()},
+        },
+        **summaries,
     }
-    final_index.update({key: value for key, value in all_summaries.items() if value})
 
     output_path = Path(top_level_output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
     index_file_path = output_path / "index.json"
-    with open(index_file_path, "w", encoding="utf-8") as f:
-        json.dump(final_index, f, indent=4, ensure_ascii=False)
+    with open(index_file_path, "wb") as f:
+        f.write(json_dumps(final_index, pretty=pretty, append_newline=True))
 
     logger.info(f"Top-level index.json created successfully at '{index_file_path}'")
 
@@ -281,7 +349,10 @@ def main() -> None:
             config["scraper_cache_dir"] = None
             config["cache_expires"] = None
 
-        api_client = ApiClient(config)
+        # Reuse the process-wide client (and its connection pool) for default
+        # runs; a --no-cache run needs its own client built from the
+        # cache-stripped config.
+        api_client = ApiClient(config) if args.no_cache else get_api_client()
 
         # Determine target generation(s)
         latest_gen_num = get_latest_generation(api_client, config)
@@ -295,6 +366,10 @@ def main() -> None:
                 target_gen = latest_gen_num
             generations_to_parse = [target_gen]
 
+        # The Pokédex map does not depend on the target generation; fetch it
+        # once up front so multi-generation runs don't repeat the work.
+        shared_dex_map = get_generation_dex_map(api_client, config)
+
         # Process each generation
         for target_gen in generations_to_parse:
             is_historical = target_gen < latest_gen_num
@@ -306,38 +381,57 @@ def main() -> None:
 
             # Gather initial data
             generation_version_groups, generation_dex_map, target_versions = (
-                gather_initial_data(api_client, config, target_gen)
+                gather_initial_data(api_client, config, target_gen, shared_dex_map)
             )
 
             logger.info(f"\n{'='*10} PARSING ALL DATA FOR GENERATION {target_gen} {'='*10}")
 
-            # Format output directory paths with generation number
-            final_config = config.copy()
-            for key in final_config:
-                if key.startswith("output_dir_"):
-                    final_config[key] = final_config[key].format(gen_num=target_gen)
+            # Materialize output directory paths for this generation once;
+            # parsers keep receiving them through the config dict.
+            output_paths = OutputPaths.from_config(config, target_gen)
+            final_config = {**config, **output_paths.as_config_overrides()}
 
             # Check if output directory exists
-            top_level_output_dir = Path(final_config["output_dir_ability"]).parent
-            if top_level_output_dir.exists():
-                if args.force:
-                    logger.info(f"Deleting existing directory: '{top_level_output_dir}'")
-                    shutil.rmtree(top_level_output_dir)
-                else:
-                    response = input(
-                        f"Directory '{top_level_output_dir}' already exists. Delete it? (y/n): "
+            top_level_output_dir = Path(output_paths.ability).parent
+            if top_level_output_dir.exists() and not args.force:
+                response = input(
+                    f"Directory '{top_level_output_dir}' already exists. Overwrite it? (y/n): "
+                )
+                if response.lower() != "y":
+                    logger.info("Operation cancelled.")
+                    return
+
+            # Parse into a staging directory and swap it in at the end. This
+            # avoids stalling startup on deleting thousands of files from the
+            # previous run, and a failed parse never leaves the published
+            # directory half-written.
+            staging_dir = top_level_output_dir.with_name(
+                top_level_output_dir.name + ".tmp"
+            )
+            if staging_dir.exists():
+                shutil.rmtree(staging_dir)
+
+            staging_config = {
+                key: (
+                    value.replace(
+                        str(top_level_output_dir), str(staging_dir), 1
                     )
-                    if response.lower() == "y":
-                        logger.info(f"Deleting existing directory: '{top_level_output_dir}'")
-                        shutil.rmtree(top_level_output_dir)
-                    else:
-                        logger.info("Operation cancelled.")
-                        return
+                    if key.startswith("output_dir_")
+                    else value
+                )
+                for key, value in final_config.items()
+            }
+
+            # Create all output directories up front so the per-file write
+            # path never has to re-check them.
+            for key, value in staging_config.items():
+                if key.startswith("output_dir_"):
+                    Path(value).mkdir(parents=True, exist_ok=True)
 
             # Run parsers
             all_summaries = run_parsers(
                 args,
-                final_config,
+                staging_config,
                 api_client,
                 generation_version_groups,
                 target_gen,
@@ -350,10 +444,35 @@ def main() -> None:
             write_index_file(
                 all_summaries,
                 target_gen,
-                str(top_level_output_dir),
+                str(staging_dir),
                 generation_version_groups,
+                pretty=args.pretty,
             )
 
+            # Publish the staging directory atomically; cleaning up the old
+            # tree doesn't affect the published data, so it runs in the
+            # background.
+            if staging_dir.exists():
+                if top_level_output_dir.exists():
+                    old_dir = top_level_output_dir.with_name(
+                        top_level_output_dir.name + ".old"
+                    )
+                    if old_dir.exists():
+                        shutil.rmtree(old_dir)
+                    os.replace(top_level_output_dir, old_dir)
+                    os.replace(staging_dir, top_level_output_dir)
+                    threading.Thread(
+                        target=shutil.rmtree,
+                        args=(old_dir,),
+                        kwargs={"ignore_errors": True},
+                    ).start()
+                else:
+                    top_level_output_dir.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(staging_dir, top_level_output_dir)
+                logger.info(f"Output published to '{top_level_output_dir}'")
+            else:
+                logger.warning("No output was produced; existing data left untouched.")
+
     except (ConfigurationError, GenerationNotFoundError, PokedexMappingError) as e:
         logger.error(f"Fatal error: {e}")
         sys.exit(1)
@@ -1,13 +1,15 @@
-import json
 import logging
+import os
+import threading
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 import requests
 from requests.adapters import HTTPAdapter, Retry
 
-from .utils import SERVER_ERROR_CODES, get_cache_path
+from .utils import SERVER_ERROR_CODES, get_cache_path, json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -36,13 +38,17 @@ class ApiClient:
         """
         self._session = self._setup_session(config)
         self._cache: Dict[str, Dict[str, Any]] = {}
+        # Guards the miss path: concurrent workers asking for the same URL
+        # coalesce onto one fetch instead of racing duplicate requests.
+        self._cache_lock = threading.Lock()
+        self._in_flight: Dict[str, threading.Event] = {}
         self.timeout: int = config.get("timeout", 15)
         self.cache_dir: Optional[str] = config.get("parser_cache_dir")
         self.cache_expires: Optional[int] = config.get("cache_expires")
 
         if self.cache_dir:
             Path(self.cache_dir).mkdir(parents=True, exist_ok=True)
-            logger.debug(f"Cache directory initialized at {self.cache_dir}")
+            logger.debug("Cache directory initialized at %s", self.cache_dir)
 
     def _setup_session(self, config: Dict[str, Any]) -> requests.Session:
         """
@@ -60,9 +66,28 @@ class ApiClient:
             backoff_factor=0.5,
             status_forcelist=SERVER_ERROR_CODES,
         )
-        session.mount("https://", HTTPAdapter(max_retries=retries))
+
+        # All parsers fan their worker threads out over this one session, so
+        # size the connection pool to the configured concurrency; the default
+        # pool of 10 would make extra threads re-dial TCP/TLS per request.
+        pool_size = max(32, config.get("max_workers", 10) * 2)
+        adapter = HTTPAdapter(
+            max_retries=retries,
+            pool_connections=4,
+            pool_maxsize=pool_size,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        # JSON payloads compress heavily; ask for gzip explicitly.
+        session.headers["Accept-Encoding"] = "gzip, deflate"
         return session
 
+    @staticmethod
+    def _etag_path(cache_file_path: Path) -> Path:
+        """Returns the sidecar path holding the ETag for a cache entry."""
+        return cache_file_path.with_suffix(".etag")
+
     def get(self, url: str) -> Dict[str, Any]:
         """
         Fetches JSON data from a URL, using both in-memory and file-based caches.
@@ -70,9 +95,16 @@ class ApiClient:
         The caching strategy is:
         1. Check in-memory cache first (fastest)
         2. Check file cache if enabled and not expired
-        3. Make HTTP request if no valid cache exists
+        3. Make HTTP request if no valid cache exists; an expired cache entry
+           with a stored ETag is revalidated with If-None-Match, so unchanged
+           resources cost a 304 with no body transfer instead of a refetch
         4. Update both caches with the response
 
+        Worker threads requesting the same URL concurrently share one fetch:
+        the first caller performs it while the rest wait on its result, so
+        shared reference URLs are retrieved once per process rather than once
+        per worker that happens to miss.
+
         Args:
             url: The API endpoint URL to fetch
 
@@ -84,13 +116,40 @@ class ApiClient:
             requests.Timeout: If the request times out
             json.JSONDecodeError: If the response is not valid JSON
         """
-        # Check in-memory cache first
-        if url in self._cache:
-            logger.debug(f"Cache hit (memory): {url}")
-            return self._cache[url]
-
+        # Lock-free fast path for the overwhelmingly common warm case.
+        cached = self._cache.get(url)
+        if cached is not None:
+            logger.debug("Cache hit (memory): %s", url)
+            return cached
+
+        # Miss: either become the fetching thread for this URL or wait for
+        # the thread that already is, then re-check the cache.
+        while True:
+            with self._cache_lock:
+                cached = self._cache.get(url)
+                if cached is not None:
+                    logger.debug("Cache hit (memory): %s", url)
+                    return cached
+                leader_done = self._in_flight.get(url)
+                if leader_done is None:
+                    self._in_flight[url] = threading.Event()
+                    break
+            leader_done.wait()
+
+        try:
+            return self._fetch(url)
+        finally:
+            # Wake any waiters; if the fetch failed they retry as the new
+            # fetching thread and surface their own error.
+            with self._cache_lock:
+                self._in_flight.pop(url).set()
+
+    def _fetch(self, url: str) -> Dict[str, Any]:
+        """Performs the cache-file lookup and HTTP fetch behind get()."""
         # Check file cache if enabled
         cache_file_path: Optional[Path] = None
+        stale_etag: Optional[str] = None
+        has_stale_body = False
         if self.cache_dir and self.cache_expires is not None:
             cache_file_path = get_cache_path(url, self.cache_dir)
 
@@ -99,26 +158,91 @@ class ApiClient:
                 cache_age = time.time() - file_mod_time
 
                 if cache_age < self.cache_expires:
-                    logger.debug(f"Cache hit (file): {url}")
-                    with open(cache_file_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        self._cache[url] = data
-                        return data
+                    logger.debug("Cache hit (file): %s", url)
+                    with open(cache_file_path, "rb") as f:
+                        raw = f.read()
+                    data = json_loads(raw)
+                    self._cache[url] = data
+                    return data
                 else:
-                    logger.debug(f"Cache expired for: {url}")
-
-        # Fetch from API
-        logger.debug(f"Fetching from API: {url}")
-        response = self._session.get(url, timeout=self.timeout)
-        response.raise_for_status()
-        data = response.json()
+                    logger.debug("Cache expired for: %s", url)
+                    has_stale_body = True
+                    try:
+                        stale_etag = self._etag_path(cache_file_path).read_text(
+                            encoding="utf-8"
+                        )
+                    except OSError:
+                        stale_etag = None
+
+        # Fetch from API, revalidating an expired cache entry when possible
+        logger.debug("Fetching from API: %s", url)
+        headers = {"If-None-Match": stale_etag} if stale_etag else None
+        try:
+            response = self._session.get(url, timeout=self.timeout, headers=headers)
+
+            if response.status_code == 304 and cache_file_path is not None:
+                # Resource unchanged: refresh the entry's TTL and reuse its body.
+                logger.debug("Cache revalidated (304): %s", url)
+                os.utime(cache_file_path)
+                with open(cache_file_path, "rb") as f:
+                    data = json_loads(f.read())
+                self._cache[url] = data
+                return data
+
+            response.raise_for_status()
+        except requests.RequestException:
+            # Session retries are exhausted at this point. PokéAPI data is
+            # effectively static, so an expired cache entry beats failing the
+            # whole parse over a transient outage.
+            if has_stale_body and cache_file_path is not None:
+                logger.warning("API fetch failed for %s; serving stale cache", url)
+                with open(cache_file_path, "rb") as f:
+                    data = json_loads(f.read())
+                self._cache[url] = data
+                return data
+            raise
+        # Decode the raw UTF-8 bytes directly rather than going through
+        # response.json(); json_loads takes the orjson fast path when
+        # available.
+        data = json_loads(response.content)
 
         # Update in-memory cache
         self._cache[url] = data
 
-        # Update file cache if enabled
+        # Update file cache if enabled. Cache files are machine-read only, so
+        # write them compactly to cut both serialization time and disk usage.
+        # Writing to a sibling temp file and renaming keeps a crashed or
+        # interrupted run from leaving a truncated cache entry that would
+        # poison later reads.
         if cache_file_path:
-            with open(cache_file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
+            payload = json_dumps(data)
+            tmp_path = cache_file_path.with_suffix(".json.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_file_path)
+
+            # Persist the ETag alongside the body for later revalidation.
+            etag = response.headers.get("ETag")
+            if etag:
+                try:
+                    self._etag_path(cache_file_path).write_text(
+                        etag, encoding="utf-8"
+                    )
+                except OSError as e:
+                    logger.debug("Could not store ETag for %s: %s", url, e)
 
         return data
+
+
+@lru_cache(maxsize=1)
+def get_api_client() -> "ApiClient":
+    """
+    Returns a process-wide ApiClient built from the default configuration.
+
+    Long-lived processes (schedulers, notebooks, library use) that run the
+    pipeline repeatedly share one TCP/TLS connection pool and in-memory cache
+    instead of rebuilding them on every invocation.
+    """
+    from .utils import load_config
+
+    return ApiClient(load_config())
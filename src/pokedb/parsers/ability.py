@@ -6,6 +6,7 @@ from ..utils import (
     build_version_group_to_generation_map,
     get_all_english_entries_for_gen_by_game,
     get_english_entry,
+    get_english_entry_fields,
     write_json_file,
 )
 from .generation import GenerationParser
@@ -63,6 +64,12 @@ class AbilityParser(GenerationParser):
         try:
             data = self.api_client.get(resource_ref["url"])
 
+            # effect and short_effect live on the same English entry, so
+            # extract both in a single scan.
+            effects = get_english_entry_fields(
+                data.get("effect_entries", []), ["effect", "short_effect"]
+            )
+
             # Build the basic ability data structure
             cleaned_data = {
                 "id": data["id"],
@@ -70,10 +77,8 @@ class AbilityParser(GenerationParser):
                 "source_url": resource_ref["url"],
                 "is_main_series": data.get("is_main_series"),
                 "generation": data.get("generation", {}).get("name"),
-                "effect": get_english_entry(data.get("effect_entries", []), "effect"),
-                "short_effect": get_english_entry(
-                    data.get("effect_entries", []), "short_effect"
-                ),
+                "effect": effects["effect"],
+                "short_effect": effects["short_effect"],
                 "flavor_text": get_all_english_entries_for_gen_by_game(
                     data.get("flavor_text_entries", []),
                     "flavor_text",
@@ -94,15 +99,11 @@ class AbilityParser(GenerationParser):
                 effect_map = {}
 
                 # short_effect is not tracked in effect_changes, so use the latest version
-                latest_short_effect = get_english_entry(
-                    data.get("effect_entries", []), "short_effect"
-                )
+                latest_short_effect = cleaned_data["short_effect"]
 
                 # Build effect map for each version group in the target generation
                 for version_group_name in target_gen_version_groups:
-                    current_effect = get_english_entry(
-                        data.get("effect_entries", []), "effect"
-                    )
+                    current_effect = cleaned_data["effect"]
 
                     # Get all effect changes up to and including the target generation, sorted chronologically
                     sorted_effect_changes = sorted(
@@ -144,7 +145,12 @@ class AbilityParser(GenerationParser):
 
             # Write to file
             output_path = self.config[self.output_dir_key]
-            write_json_file(output_path, cleaned_data["name"], cleaned_data)
+            write_json_file(
+                output_path,
+                cleaned_data["name"],
+                cleaned_data,
+                compact=self.config.get("compact_output", False),
+            )
 
             return {"name": cleaned_data["name"], "id": cleaned_data["id"]}
 
@@ -128,7 +128,11 @@ class BaseParser(ABC):
             category.value: [] for category in PokemonCategory
         }
 
-        with ThreadPoolExecutor(max_workers=self.config["max_workers"]) as executor:
+        # The workload is almost entirely I/O wait, so max_workers (not CPU
+        # count) governs throughput; clamp it to the number of references so
+        # small parsers don't spawn threads that never receive a task.
+        worker_count = min(self.config["max_workers"], len(all_references))
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
             # Submit all processing tasks
             future_map = {
                 executor.submit(self.process, ref): ref for ref in all_references
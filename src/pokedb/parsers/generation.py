@@ -1,5 +1,5 @@
 from logging import getLogger
-from typing import Dict, List
+from typing import Dict, List, Set
 
 from .base import BaseParser
 
@@ -30,21 +30,30 @@ class GenerationParser(BaseParser):
             A list of resource reference dictionaries with 'name' and 'url' keys
         """
         all_references: List[Dict[str, str]] = []
+        seen_urls: Set[str] = set()
 
         if self.target_gen:
             logger.info(
                 f"Collecting all {self.entity_type.lower()}s up to Generation {self.target_gen}..."
             )
 
+            generation_base = self.config["api_base_url"] + "generation/"
             for generation_num in range(1, self.target_gen + 1):
                 try:
-                    generation_url = (
-                        f"{self.config['api_base_url']}generation/{generation_num}"
-                    )
+                    generation_url = generation_base + str(generation_num)
                     generation_data = self.api_client.get(generation_url)
 
                     resources_in_gen = generation_data.get(self.api_endpoint, [])
-                    all_references.extend(resources_in_gen)
+
+                    # Deduplicate by URL: the API occasionally lists the same
+                    # resource under multiple generations, and every duplicate
+                    # would cost a full fetch-and-write in process().
+                    for resource_ref in resources_in_gen:
+                        url = resource_ref.get("url")
+                        if url in seen_urls:
+                            continue
+                        seen_urls.add(url)
+                        all_references.append(resource_ref)
 
                     logger.debug(
                         f"Generation {generation_num}: Found {len(resources_in_gen)} {self.entity_type.lower()}(s)"
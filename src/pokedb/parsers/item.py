@@ -4,8 +4,9 @@ from typing import Any, Dict, List, Optional, Union
 from ..api_client import ApiClient
 from ..utils import (
     DEFAULT_API_LIMIT,
+    extract_id_from_url,
     get_all_english_entries_for_gen_by_game,
-    get_english_entry,
+    get_english_entry_fields,
     write_json_file,
 )
 from .base import BaseParser
@@ -83,20 +84,27 @@ class ItemParser(BaseParser):
             if not game_indices:
                 return None
 
-            # Determine which generations this item appears in
-            item_generations = {
-                int(game_index["generation"]["url"].split("/")[-2])
+            # Only process if item exists in the target generation; a single
+            # pass with early exit avoids materializing the full generation
+            # set for the common miss case.
+            in_target_gen = self.target_gen is not None and any(
+                extract_id_from_url(game_index["generation"]["url"])
+                == self.target_gen
                 for game_index in game_indices
-            }
-
-            # Only process if item exists in the target generation
-            if self.target_gen is not None and self.target_gen in item_generations:
+            )
+            if in_target_gen:
                 # Extract fling effect name if it exists
                 fling_effect_obj = data.get("fling_effect")
                 fling_effect_name = (
                     fling_effect_obj.get("name") if fling_effect_obj else None
                 )
 
+                # effect and short_effect live on the same English entry, so
+                # extract both in a single scan.
+                effects = get_english_entry_fields(
+                    data.get("effect_entries", []), ["effect", "short_effect"]
+                )
+
                 cleaned_data = {
                     "id": data["id"],
                     "name": data["name"],
@@ -106,12 +114,8 @@ class ItemParser(BaseParser):
                     "fling_effect": fling_effect_name,
                     "attributes": [attr["name"] for attr in data.get("attributes", [])],
                     "category": data.get("category", {}).get("name"),
-                    "effect": get_english_entry(
-                        data.get("effect_entries", []), "effect"
-                    ),
-                    "short_effect": get_english_entry(
-                        data.get("effect_entries", []), "short_effect"
-                    ),
+                    "effect": effects["effect"],
+                    "short_effect": effects["short_effect"],
                     "flavor_text": get_all_english_entries_for_gen_by_game(
                         data.get("flavor_text_entries", []),
                         "text",
@@ -123,7 +127,12 @@ class ItemParser(BaseParser):
 
                 # Write to file
                 output_path = self.config[self.output_dir_key]
-                write_json_file(output_path, cleaned_data["name"], cleaned_data)
+                write_json_file(
+                    output_path,
+                    cleaned_data["name"],
+                    cleaned_data,
+                    compact=self.config.get("compact_output", False),
+                )
 
                 return {
                     "name": cleaned_data["name"],
@@ -5,7 +5,7 @@ from ..api_client import ApiClient
 from ..utils import (
     build_version_group_to_generation_map,
     get_all_english_entries_for_gen_by_game,
-    get_english_entry,
+    get_english_entry_fields,
     write_json_file,
 )
 from .generation import GenerationParser
@@ -215,10 +215,11 @@ class MoveParser(GenerationParser):
                 if past_value.get("type"):
                     temp_data["type"] = past_value["type"]["name"]
                 if past_value.get("effect_entries"):
-                    effect = get_english_entry(past_value["effect_entries"], "effect")
-                    short_effect = get_english_entry(
-                        past_value["effect_entries"], "short_effect"
+                    past_effects = get_english_entry_fields(
+                        past_value["effect_entries"], ["effect", "short_effect"]
                     )
+                    effect = past_effects["effect"]
+                    short_effect = past_effects["short_effect"]
                     if effect:
                         temp_data["effect"] = effect
                     if short_effect:
@@ -250,6 +251,12 @@ class MoveParser(GenerationParser):
         try:
             data = self.api_client.get(resource_ref["url"])
 
+            # effect and short_effect live on the same English entry, so
+            # extract both in a single scan.
+            effects = get_english_entry_fields(
+                data.get("effect_entries", []), ["effect", "short_effect"]
+            )
+
             # Build the basic move data structure
             cleaned_data = {
                 "id": data["id"],
@@ -264,10 +271,8 @@ class MoveParser(GenerationParser):
                 "target": data.get("target", {}).get("name"),
                 "generation": data.get("generation", {}).get("name"),
                 "effect_chance": data.get("effect_chance"),
-                "effect": get_english_entry(data.get("effect_entries", []), "effect"),
-                "short_effect": get_english_entry(
-                    data.get("effect_entries", []), "short_effect"
-                ),
+                "effect": effects["effect"],
+                "short_effect": effects["short_effect"],
                 "flavor_text": get_all_english_entries_for_gen_by_game(
                     data.get("flavor_text_entries", []),
                     "flavor_text",
@@ -291,7 +296,12 @@ class MoveParser(GenerationParser):
 
             # Write to file
             output_path = self.config[self.output_dir_key]
-            write_json_file(output_path, cleaned_data["name"], cleaned_data)
+            write_json_file(
+                output_path,
+                cleaned_data["name"],
+                cleaned_data,
+                compact=self.config.get("compact_output", False),
+            )
 
             return {"name": cleaned_data["name"], "id": cleaned_data["id"]}
 
@@ -4,6 +4,7 @@ from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from ..api_client import ApiClient
 from ..utils import (
+    extract_id_from_url,
     get_all_english_entries_by_version,
     get_english_entry,
     int_to_roman,
@@ -107,7 +108,7 @@ class PokemonParser(GenerationParser):
         if not self.target_gen or not self.scraper_func:
             return
 
-        logger.debug(f"Scraping historical changes for {cleaned_data['species']}")
+        logger.debug("Scraping historical changes for %s", cleaned_data["species"])
         scraper_data = self.scraper_func(cleaned_data["species"])
         all_changes = scraper_data.get("changes", [])
 
@@ -203,7 +204,7 @@ class PokemonParser(GenerationParser):
 
     def _get_evolution_chain(self, chain_url: str) -> Optional[Dict[str, Any]]:
         """
-        Recursively fetches and processes an evolution chain, filtering future generations.
+        Fetches and processes an evolution chain, filtering future generations.
 
         Evolution chains are nested structures showing species → evolutions → further evolutions.
         This method filters out evolutions that don't exist in the target generation.
@@ -239,74 +240,80 @@ class PokemonParser(GenerationParser):
                 return None
 
             chain_data = response["chain"]
+            root: Dict[str, Any] = {
+                "species_name": chain_data["species"]["name"],
+                "evolves_to": [],
+            }
 
-            def recurse_chain(chain: Dict[str, Any]) -> Dict[str, Any]:
-                species_name = chain["species"]["name"]
-                evolves_to: List[Dict[str, Any]] = []
+            # Walk the chain with an explicit stack instead of recursion;
+            # this drops the per-call frame overhead and removes any depth
+            # limit concern for long branching chains.
+            stack: List[tuple] = [(chain_data, root)]
+            while stack:
+                chain, node = stack.pop()
+                evolves_to = node["evolves_to"]
 
                 for evolution in chain.get("evolves_to", []):
                     # Check if this evolution is from a future generation
                     species_url = evolution["species"]["url"]
                     species_data = self.api_client.get(species_url)
-                    evolution_gen = int(
-                        species_data["generation"]["url"].split("/")[-2]
+                    evolution_gen = extract_id_from_url(
+                        species_data["generation"]["url"]
                     )
 
                     # Skip evolutions from future generations
                     if self.target_gen is not None and evolution_gen > self.target_gen:
                         logger.debug(
-                            f"Skipping future evolution: {evolution['species']['name']} (Gen {evolution_gen})"
+                            "Skipping future evolution: %s (Gen %d)",
+                            evolution["species"]["name"],
+                            evolution_gen,
                         )
                         continue
 
                     details_list = evolution.get("evolution_details", [])
                     details = details_list[0] if details_list else {}
-                    next_evolution = recurse_chain(evolution)
-                    evolves_to.append(
-                        {
-                            "species_name": next_evolution["species_name"],
-                            "evolution_details": {
-                                "item": (details.get("item") or {}).get("name"),
-                                "trigger": (details.get("trigger") or {}).get("name"),
-                                "gender": details.get("gender"),
-                                "held_item": (details.get("held_item") or {}).get(
-                                    "name"
-                                ),
-                                "known_move": (details.get("known_move") or {}).get(
-                                    "name"
-                                ),
-                                "known_move_type": (
-                                    details.get("known_move_type") or {}
-                                ).get("name"),
-                                "location": (details.get("location") or {}).get("name"),
-                                "min_level": details.get("min_level"),
-                                "min_happiness": details.get("min_happiness"),
-                                "min_beauty": details.get("min_beauty"),
-                                "min_affection": details.get("min_affection"),
-                                "needs_overworld_rain": details.get(
-                                    "needs_overworld_rain"
-                                ),
-                                "party_species": (
-                                    details.get("party_species") or {}
-                                ).get("name"),
-                                "party_type": (details.get("party_type") or {}).get(
-                                    "name"
-                                ),
-                                "relative_physical_stats": details.get(
-                                    "relative_physical_stats"
-                                ),
-                                "time_of_day": details.get("time_of_day"),
-                                "trade_species": (
-                                    details.get("trade_species") or {}
-                                ).get("name"),
-                                "turn_upside_down": details.get("turn_upside_down"),
-                            },
-                            "evolves_to": next_evolution["evolves_to"],
-                        }
-                    )
-                return {"species_name": species_name, "evolves_to": evolves_to}
+                    child: Dict[str, Any] = {
+                        "species_name": evolution["species"]["name"],
+                        "evolution_details": {
+                            "item": (details.get("item") or {}).get("name"),
+                            "trigger": (details.get("trigger") or {}).get("name"),
+                            "gender": details.get("gender"),
+                            "held_item": (details.get("held_item") or {}).get("name"),
+                            "known_move": (details.get("known_move") or {}).get(
+                                "name"
+                            ),
+                            "known_move_type": (
+                                details.get("known_move_type") or {}
+                            ).get("name"),
+                            "location": (details.get("location") or {}).get("name"),
+                            "min_level": details.get("min_level"),
+                            "min_happiness": details.get("min_happiness"),
+                            "min_beauty": details.get("min_beauty"),
+                            "min_affection": details.get("min_affection"),
+                            "needs_overworld_rain": details.get(
+                                "needs_overworld_rain"
+                            ),
+                            "party_species": (details.get("party_species") or {}).get(
+                                "name"
+                            ),
+                            "party_type": (details.get("party_type") or {}).get(
+                                "name"
+                            ),
+                            "relative_physical_stats": details.get(
+                                "relative_physical_stats"
+                            ),
+                            "time_of_day": details.get("time_of_day"),
+                            "trade_species": (details.get("trade_species") or {}).get(
+                                "name"
+                            ),
+                            "turn_upside_down": details.get("turn_upside_down"),
+                        },
+                        "evolves_to": [],
+                    }
+                    evolves_to.append(child)
+                    stack.append((evolution, child))
 
-            return recurse_chain(chain_data)
+            return root
         except Exception as e:
             logger.warning(
                 f"Could not process evolution chain from {chain_url}. Error: {e}"
@@ -466,7 +473,7 @@ class PokemonParser(GenerationParser):
                 )
                 return False
 
-            form_introduction_gen = int(generation_url.split("/")[-2])
+            form_introduction_gen = extract_id_from_url(generation_url)
             return (
                 self.target_gen is not None and form_introduction_gen > self.target_gen
             )
@@ -645,7 +652,8 @@ class PokemonParser(GenerationParser):
             forms = pokemon_data.get("forms", [])
             if not forms:
                 logger.debug(
-                    f"Variety {pokemon_data['name']} has no forms, will be skipped during processing."
+                    "Variety %s has no forms, will be skipped during processing.",
+                    pokemon_data["name"],
                 )
                 continue
 
@@ -724,7 +732,12 @@ class PokemonParser(GenerationParser):
             self._apply_historical_changes(default_template)
 
         output_dir = self.config[self.output_dir_key_pokemon]
-        write_json_file(output_dir, default_template["name"], default_template)
+        write_json_file(
+            output_dir,
+            default_template["name"],
+            default_template,
+            compact=self.config.get("compact_output", False),
+        )
 
         return default_template
 
@@ -758,7 +771,7 @@ class PokemonParser(GenerationParser):
 
         # Skip varieties with no forms
         if not pokemon_data.get("forms"):
-            logger.debug(f"Skipping variety {pokemon_data['name']}: No forms found.")
+            logger.debug("Skipping variety %s: No forms found.", pokemon_data["name"])
             return None
 
         forms = pokemon_data.get("forms", [])
@@ -798,7 +811,12 @@ class PokemonParser(GenerationParser):
 
         # Write to file
         output_dir = self.config[output_key]
-        write_json_file(output_dir, variant_data["name"], variant_data)
+        write_json_file(
+            output_dir,
+            variant_data["name"],
+            variant_data,
+            compact=self.config.get("compact_output", False),
+        )
 
         # Return summary
         summary = {
@@ -848,7 +866,12 @@ class PokemonParser(GenerationParser):
 
         # Write to file
         output_dir = self.config[self.output_dir_key_cosmetic]
-        write_json_file(output_dir, cosmetic_data["name"], cosmetic_data)
+        write_json_file(
+            output_dir,
+            cosmetic_data["name"],
+            cosmetic_data,
+            compact=self.config.get("compact_output", False),
+        )
 
         # Return summary
         return {
@@ -2,11 +2,13 @@ import json
 import logging
 import re
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import requests
 from bs4 import BeautifulSoup, Tag
+from requests.adapters import HTTPAdapter
 
 from .utils import get_cache_path, load_config, parse_gen_range
 
@@ -17,6 +19,25 @@ MAX_RETRIES = 3
 RETRY_DELAY_SECONDS = 5
 REQUEST_TIMEOUT_SECONDS = 10
 
+# One pooled session shared by all scrape calls; keep-alive reuse avoids a
+# fresh TCP/TLS handshake against pokemondb.net for every Pokémon, which
+# matters when the Pokémon parser scrapes from many worker threads at once.
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+
+@lru_cache(maxsize=1)
+def _get_config() -> Dict[str, Any]:
+    """
+    Loads and memoizes the scraper configuration.
+
+    scrape_pokemon_changes runs once per Pokémon from many worker threads, so
+    re-reading and re-validating config.json on every call was pure overhead.
+    """
+    return load_config()
+
 
 def scrape_pokemon_changes(pokemon_name: str) -> Dict[str, Any]:
     """
@@ -37,7 +58,7 @@ def scrape_pokemon_changes(pokemon_name: str) -> Dict[str, Any]:
         >>> scrape_pokemon_changes("pikachu")
         {'metadata': {'name': 'pikachu', 'source': '...'}, 'changes': [...]}
     """
-    config = load_config()
+    config = _get_config()
     cache_dir = config.get("scraper_cache_dir")
     cache_expires = config.get("cache_expires")
 
@@ -53,7 +74,7 @@ def scrape_pokemon_changes(pokemon_name: str) -> Dict[str, Any]:
         if cache_file_path.exists():
             file_mod_time = cache_file_path.stat().st_mtime
             if time.time() - file_mod_time < cache_expires:
-                logger.debug(f"Cache hit for {pokemon_name}")
+                logger.debug("Cache hit for %s", pokemon_name)
                 with open(cache_file_path, "r", encoding="utf-8") as f:
                     return json.load(f)
 
@@ -64,21 +85,23 @@ def scrape_pokemon_changes(pokemon_name: str) -> Dict[str, Any]:
     for attempt in range(MAX_RETRIES):
         try:
             logger.debug(
-                f"Scraping {pokemon_name} (attempt {attempt + 1}/{MAX_RETRIES})"
+                "Scraping %s (attempt %d/%d)", pokemon_name, attempt + 1, MAX_RETRIES
             )
-            response = requests.get(url, timeout=REQUEST_TIMEOUT_SECONDS)
+            response = _session.get(url, timeout=REQUEST_TIMEOUT_SECONDS)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, "lxml")
             break
         except requests.RequestException as e:
             if attempt < MAX_RETRIES - 1:
                 logger.warning(
-                    f"Scraping attempt {attempt + 1} failed for {pokemon_name}, retrying..."
+                    "Scraping attempt %d failed for %s, retrying...",
+                    attempt + 1,
+                    pokemon_name,
                 )
                 time.sleep(RETRY_DELAY_SECONDS)
             else:
                 logger.error(
-                    f"Failed to scrape {url} after {MAX_RETRIES} attempts: {e}"
+                    "Failed to scrape %s after %d attempts: %s", url, MAX_RETRIES, e
                 )
                 return {}
 
@@ -97,7 +120,7 @@ def scrape_pokemon_changes(pokemon_name: str) -> Dict[str, Any]:
             None,
         )
         if not changes_header:
-            logger.debug(f"No changes section found for {pokemon_name}")
+            logger.debug("No changes section found for %s", pokemon_name)
             empty_result = {
                 "metadata": {"name": pokemon_name, "source": url},
                 "changes": [],
@@ -158,7 +181,7 @@ def scrape_pokemon_changes(pokemon_name: str) -> Dict[str, Any]:
                         )
                         break
     except Exception as e:
-        logger.warning(f"Failed to parse scraped data for {pokemon_name}: {e}")
+        logger.warning("Failed to parse scraped data for %s: %s", pokemon_name, e)
 
     # Build and cache the result
     output = {"metadata": {"name": pokemon_name, "source": url}, "changes": all_changes}
@@ -166,7 +189,7 @@ def scrape_pokemon_changes(pokemon_name: str) -> Dict[str, Any]:
         with open(cache_file_path, "w", encoding="utf-8") as f:
             json.dump(output, f, indent=4, ensure_ascii=False)
 
-    logger.info(f"Scraped {len(all_changes)} changes for {pokemon_name}")
+    logger.info("Scraped %d changes for %s", len(all_changes), pokemon_name)
     return output
 
 
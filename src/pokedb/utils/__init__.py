@@ -8,6 +8,7 @@ This package contains:
 - config: Configuration management
 - api_helpers: API interaction helpers
 - text_utils: Text parsing and transformation utilities
+- json_io: JSON encoding/decoding with an optional orjson fast path
 """
 
 # Exceptions
@@ -29,8 +30,11 @@ from .constants import (
 # File operations
 from .file_ops import get_cache_path, write_json_file
 
+# JSON encoding/decoding
+from .json_io import json_dumps, json_loads
+
 # Configuration
-from .config import load_config
+from .config import OutputPaths, load_config
 
 # API helpers
 from .api_helpers import get_generation_dex_map, get_latest_generation
@@ -38,9 +42,11 @@ from .api_helpers import get_generation_dex_map, get_latest_generation
 # Text utilities
 from .text_utils import (
     build_version_group_to_generation_map,
+    extract_id_from_url,
     get_all_english_entries_by_version,
     get_all_english_entries_for_gen_by_game,
     get_english_entry,
+    get_english_entry_fields,
     int_to_roman,
     kebab_to_snake,
     parse_gen_range,
@@ -61,7 +67,11 @@ __all__ = [
     # File operations
     "get_cache_path",
     "write_json_file",
+    # JSON encoding/decoding
+    "json_dumps",
+    "json_loads",
     # Configuration
+    "OutputPaths",
     "load_config",
     # API helpers
     "get_latest_generation",
@@ -69,10 +79,12 @@ __all__ = [
     # Text utilities
     "parse_gen_range",
     "int_to_roman",
+    "extract_id_from_url",
     "get_all_english_entries_for_gen_by_game",
     "get_all_english_entries_by_version",
     "build_version_group_to_generation_map",
     "get_english_entry",
+    "get_english_entry_fields",
     "kebab_to_snake",
     "transform_keys_to_snake_case",
 ]
@@ -2,17 +2,64 @@
 
 from __future__ import annotations
 
+import json
 import logging
-from typing import TYPE_CHECKING, Any, Dict
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 if TYPE_CHECKING:
     from ..api_client import ApiClient
 
 from .exceptions import GenerationNotFoundError, PokedexMappingError
+from .file_ops import get_cache_path
+from .text_utils import extract_id_from_url
 
 logger = logging.getLogger(__name__)
 
 
+def _read_cached_result(config: Dict[str, Any], key: str) -> Optional[Any]:
+    """
+    Reads a memoized helper result from the parser cache directory.
+
+    Results are keyed by API base URL so switching endpoints never serves
+    stale data. Returns None when caching is disabled, the entry is missing,
+    expired, or unreadable.
+    """
+    cache_dir = config.get("parser_cache_dir")
+    cache_expires = config.get("cache_expires")
+    if not cache_dir or cache_expires is None:
+        return None
+
+    cache_path = get_cache_path(f"{config['api_base_url']}#{key}", cache_dir)
+    if not cache_path.exists():
+        return None
+
+    if time.time() - cache_path.stat().st_mtime >= cache_expires:
+        return None
+
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _write_cached_result(config: Dict[str, Any], key: str, value: Any) -> None:
+    """Persists a memoized helper result to the parser cache directory."""
+    cache_dir = config.get("parser_cache_dir")
+    if not cache_dir or config.get("cache_expires") is None:
+        return
+
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    cache_path = get_cache_path(f"{config['api_base_url']}#{key}", cache_dir)
+    try:
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump(value, f)
+    except OSError as e:
+        logger.debug(f"Could not write cached result for {key}: {e}")
+
+
 def get_latest_generation(api_client: ApiClient, config: Dict[str, Any]) -> int:
     """
     Finds the latest Pokémon generation number by querying the API.
@@ -27,6 +74,11 @@ def get_latest_generation(api_client: ApiClient, config: Dict[str, Any]) -> int:
     Raises:
         GenerationNotFoundError: If generation data cannot be retrieved or parsed
     """
+    cached = _read_cached_result(config, "latest_generation")
+    if cached is not None:
+        logger.debug(f"Using cached latest generation: {cached}")
+        return int(cached)
+
     logger.info("Determining the latest Pokémon generation...")
     try:
         data = api_client.get(f"{config['api_base_url']}generation/")
@@ -36,9 +88,10 @@ def get_latest_generation(api_client: ApiClient, config: Dict[str, Any]) -> int:
             raise GenerationNotFoundError("No generations found in API response.")
 
         latest_gen_num = max(
-            int(generation["url"].split("/")[-2]) for generation in generations
+            extract_id_from_url(generation["url"]) for generation in generations
         )
         logger.info(f"Latest generation found: {latest_gen_num}")
+        _write_cached_result(config, "latest_generation", latest_gen_num)
         return latest_gen_num
 
     except (KeyError, ValueError, IndexError) as e:
@@ -63,6 +116,12 @@ def get_generation_dex_map(
     Raises:
         PokedexMappingError: If Pokédex data cannot be retrieved or mapped
     """
+    cached = _read_cached_result(config, "generation_dex_map")
+    if cached is not None:
+        logger.debug("Using cached Pokédex map")
+        # JSON object keys are strings; restore the integer generation keys.
+        return {int(gen_num): dex_name for gen_num, dex_name in cached.items()}
+
     logger.info("Fetching Pokédex information...")
     dex_map: Dict[int, str] = {}
 
@@ -82,8 +141,8 @@ def get_generation_dex_map(
                 version_group_data = api_client.get(
                     dex_data["version_groups"][0]["url"]
                 )
-                generation_num = int(
-                    version_group_data["generation"]["url"].split("/")[-2]
+                generation_num = extract_id_from_url(
+                    version_group_data["generation"]["url"]
                 )
 
                 # Use the first main series dex for each generation
@@ -91,6 +150,7 @@ def get_generation_dex_map(
                     dex_map[generation_num] = dex_data["name"]
 
         logger.info(f"Successfully created Pokédex map with {len(dex_map)} entries.")
+        _write_cached_result(config, "generation_dex_map", dex_map)
         return dex_map
 
     except (KeyError, ValueError, IndexError) as e:
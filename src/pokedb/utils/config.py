@@ -1,7 +1,7 @@
 """Configuration management utilities."""
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -31,6 +31,7 @@ class Config:
     output_dir_variant: str
     output_dir_transformation: str
     output_dir_cosmetic: str
+    compact_output: bool = False
 
     def __post_init__(self):
         """Validates configuration values after initialization."""
@@ -80,6 +81,46 @@ class Config:
             "output_dir_variant": self.output_dir_variant,
             "output_dir_transformation": self.output_dir_transformation,
             "output_dir_cosmetic": self.output_dir_cosmetic,
+            "compact_output": self.compact_output,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class OutputPaths:
+    """
+    Per-generation output directories, materialized once at startup.
+
+    Substituting the generation number into every output_dir_* template is
+    done a single time here instead of re-formatting strings downstream, and
+    slotted attribute access is cheaper than repeated dict lookups.
+    """
+
+    ability: str
+    item: str
+    move: str
+    pokemon: str
+    variant: str
+    transformation: str
+    cosmetic: str
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], gen_num: int) -> "OutputPaths":
+        """Builds the path set for a generation from the raw config templates."""
+        gen_str = str(gen_num)
+        return cls(
+            **{
+                field.name: config[f"output_dir_{field.name}"].replace(
+                    "{gen_num}", gen_str
+                )
+                for field in fields(cls)
+            }
+        )
+
+    def as_config_overrides(self) -> Dict[str, str]:
+        """Returns the paths as output_dir_* keys for dict-based consumers."""
+        return {
+            f"output_dir_{field.name}": getattr(self, field.name)
+            for field in fields(self)
         }
 
 
@@ -1,9 +1,14 @@
 """File operations and caching utilities."""
 
 import hashlib
-import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Set
+
+from .json_io import json_dumps
+
+# Directories already created this run; lets write_json_file skip the
+# stat/mkdir syscalls on every call after the first for a given directory.
+_created_dirs: Set[str] = set()
 
 
 def get_cache_path(url: str, cache_dir: str) -> Path:
@@ -27,7 +32,9 @@ def get_cache_path(url: str, cache_dir: str) -> Path:
     return Path(cache_dir) / f"{hashed_url}.json"
 
 
-def write_json_file(output_dir: str, filename: str, data: Dict[str, Any]) -> Path:
+def write_json_file(
+    output_dir: str, filename: str, data: Dict[str, Any], compact: bool = False
+) -> Path:
     """
     Writes data to a JSON file with proper formatting and snake_case key transformation.
 
@@ -35,6 +42,8 @@ def write_json_file(output_dir: str, filename: str, data: Dict[str, Any]) -> Pat
         output_dir: The directory where the file should be written
         filename: The name of the file (without .json extension)
         data: The data dictionary to write
+        compact: Whether to emit minified JSON; roughly halves bytes written
+                 for output that is only consumed programmatically
 
     Returns:
         Path to the written file
@@ -42,10 +51,27 @@ def write_json_file(output_dir: str, filename: str, data: Dict[str, Any]) -> Pat
     from .text_utils import transform_keys_to_snake_case
 
     output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
+    if output_dir not in _created_dirs:
+        output_path.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(output_dir)
 
     file_path = output_path / f"{filename}.json"
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(transform_keys_to_snake_case(data), f, indent=4, ensure_ascii=False)
+    transformed = transform_keys_to_snake_case(data)
+    payload = json_dumps(transformed, pretty=not compact)
+
+    # Skip the write entirely when the file already holds identical bytes;
+    # re-runs over unchanged upstream data then cost a read instead of a
+    # write and leave mtimes untouched.
+    try:
+        if (
+            file_path.stat().st_size == len(payload)
+            and file_path.read_bytes() == payload
+        ):
+            return file_path
+    except OSError:
+        pass
+
+    with open(file_path, "wb") as f:
+        f.write(payload)
 
     return file_path
@@ -0,0 +1,62 @@
+"""JSON encoding and decoding helpers with an optional orjson fast path."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserializes JSON using the fastest available decoder.
+
+    orjson decodes UTF-8 bytes directly and is several times faster than the
+    stdlib decoder on PokéAPI-shaped payloads; the stdlib is used when orjson
+    is not installed.
+
+    Args:
+        data: The JSON document as bytes or a string
+
+    Returns:
+        The deserialized Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, pretty: bool = False, append_newline: bool = False) -> bytes:
+    """
+    Serializes an object to UTF-8 JSON bytes.
+
+    Output is compact by default; pretty-printing is opt-in for files that
+    humans browse. orjson serializes in one C-level pass when available.
+
+    Args:
+        obj: The object to serialize
+        pretty: Whether to indent the output for human inspection
+        append_newline: Whether to terminate the document with a newline
+
+    Returns:
+        The serialized document as UTF-8 bytes
+    """
+    if orjson is not None:
+        option = 0
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if append_newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, option=option)
+
+    if pretty:
+        # Match orjson's OPT_INDENT_2 layout so the bytes written are
+        # identical regardless of which encoder is installed.
+        payload = json.dumps(obj, indent=2, ensure_ascii=False)
+    else:
+        payload = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    if append_newline:
+        payload += "\n"
+    return payload.encode("utf-8")
@@ -1,6 +1,7 @@
 """Text parsing and transformation utilities."""
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from .constants import MAX_ROMAN_NUMERAL, ROMAN_NUMERAL_MAP
@@ -32,10 +33,14 @@ def parse_gen_range(generation_text: str) -> Optional[List[int]]:
     return None
 
 
+@lru_cache(maxsize=32)
 def int_to_roman(num: int) -> str:
     """
     Converts an integer to a Roman numeral using the subtractive notation.
 
+    Results are memoized: in practice only the handful of generation numbers
+    are ever converted, and callers invoke this once per parsed Pokémon.
+
     Args:
         num: An integer between 1 and 3999 (inclusive)
 
@@ -62,6 +67,27 @@ def int_to_roman(num: int) -> str:
     return "".join(roman_numeral)
 
 
+def extract_id_from_url(url: str) -> int:
+    """
+    Extracts the trailing numeric resource ID from a PokéAPI URL.
+
+    Splitting once from the right allocates a two-element list instead of the
+    full path segmentation that `url.split("/")[-2]` performs; this runs for
+    every generation, species, and item reference parsed.
+
+    Args:
+        url: A PokéAPI resource URL (e.g., 'https://pokeapi.co/api/v2/generation/3/')
+
+    Returns:
+        The resource ID as an integer
+
+    Examples:
+        >>> extract_id_from_url("https://pokeapi.co/api/v2/generation/3/")
+        3
+    """
+    return int(url.rstrip("/").rsplit("/", 1)[1])
+
+
 def _get_all_english_entries_generic(
     entries: List[Dict[str, Any]],
     key_name: str,
@@ -86,15 +112,22 @@ def _get_all_english_entries_generic(
     texts: Dict[str, str] = {}
 
     for entry in entries:
-        field_value = entry.get(field_name, {}).get("name")
-
-        # Only process English entries that match our target set
-        if entry.get("language", {}).get("name") == "en" and field_value in target_set:
-            cleaned_text = " ".join(entry.get(key_name, "").split())
-
-            # Store only the first occurrence for each field value
-            if cleaned_text and field_value not in texts:
-                texts[field_value] = cleaned_text
+        # Check the language first: non-English entries are the vast majority
+        # of every entry list, so rejecting them on a single lookup (without
+        # allocating a fallback dict per miss) dominates this loop's cost.
+        language = entry.get("language")
+        if language is None or language.get("name") != "en":
+            continue
+
+        field = entry.get(field_name)
+        field_value = field.get("name") if field is not None else None
+        if field_value not in target_set or field_value in texts:
+            continue
+
+        # Store only the first occurrence for each field value
+        cleaned_text = " ".join(entry.get(key_name, "").split())
+        if cleaned_text:
+            texts[field_value] = cleaned_text
 
     return texts
 
@@ -216,11 +249,16 @@ def get_english_entry(
                 reversed(generation_version_groups.get(generation, []))
             )
 
-        # Map version groups to their English entries
+        # Map version groups to their English entries, rejecting non-English
+        # entries on the first lookup (same fast path as the generic helper).
         entry_map: Dict[str, Dict[str, Any]] = {}
         for entry in entries:
-            if entry.get("language", {}).get("name") == "en":
-                version_group_name = entry.get("version_group", {}).get("name")
+            language = entry.get("language")
+            if language is None or language.get("name") != "en":
+                continue
+            version_group = entry.get("version_group")
+            if version_group is not None:
+                version_group_name = version_group.get("name")
                 if version_group_name:
                     entry_map[version_group_name] = entry
 
@@ -231,12 +269,46 @@ def get_english_entry(
 
     # Fallback: return the first English entry found
     for entry in entries:
-        if entry.get("language", {}).get("name") == "en":
+        language = entry.get("language")
+        if language is not None and language.get("name") == "en":
             return " ".join(entry[key_name].split())
 
     return None
 
 
+def get_english_entry_fields(
+    entries: List[Dict[str, Any]],
+    key_names: List[str],
+) -> Dict[str, Optional[str]]:
+    """
+    Extracts several fields from the first English entry in a single scan.
+
+    Callers needing both 'effect' and 'short_effect' previously walked the
+    entry list once per field via get_english_entry; this locates the English
+    entry once and cleans every requested field from it.
+
+    Args:
+        entries: List of entry dictionaries from the API
+        key_names: The keys to extract from the English entry
+
+    Returns:
+        A dictionary mapping each requested key to its cleaned English text,
+        or to None when the entry lacks that key or no English entry exists
+    """
+    result: Dict[str, Optional[str]] = {key: None for key in key_names}
+
+    for entry in entries:
+        language = entry.get("language")
+        if language is not None and language.get("name") == "en":
+            for key in key_names:
+                value = entry.get(key)
+                if value is not None:
+                    result[key] = " ".join(value.split())
+            break
+
+    return result
+
+
 def kebab_to_snake(text: str) -> str:
     """
     Converts a kebab-case string to snake_case.